@@ -11,25 +11,187 @@ This script:
 Usage:
     python build-checklist.py
     ./build-checklist.py
+    python build-checklist.py --no-highlight   # skip syntax highlighting
+    python build-checklist.py -q               # suppress progress output
 """
 
+import argparse
+import hashlib
+import html
 import json
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass
 
-# Syntax highlighting support
+# Syntax highlighting support (the highlighting API itself is imported on
+# first use by _ensure_pygments, so cached builds never load it)
 try:
-    from pygments import highlight
-    from pygments.lexers import DartLexer, get_lexer_by_name
-    from pygments.formatters import HtmlFormatter
+    from pygments import __version__ as PYGMENTS_VERSION
     PYGMENTS_AVAILABLE = True
 except ImportError:
     PYGMENTS_AVAILABLE = False
+    PYGMENTS_VERSION = None
     print("⚠️  Warning: Pygments not installed. Code examples will not be syntax highlighted.")
     print("   Install with: pip install Pygments")
 
+# Faster JSON serialization support (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Precompiled patterns (compiled once at import instead of per line)
+
+# Line-level Markdown constructs; MarkdownParser.parse dispatches on the
+# outer group name (match.lastgroup). Code fences are matched whole: a fence
+# ends at its closing ``` line, or - when that is missing - just before the
+# next section/item header (or at the end of the file), so an unterminated
+# fence never swallows later sections and items.
+_RE_TOKEN = re.compile(
+    r'^(?:'
+    r'(?P<section>## Section (?P<section_num>\d+): (?P<section_title>.+))'
+    r'|(?P<item>### ☐ (?P<item_title>.+))'
+    r'|(?P<heading>###? .*)'
+    r'|(?P<what>\*\*What this means:\*\*(?P<what_rest>.*))'
+    r'|(?P<why>\*\*Why this matters:\*\*(?P<why_rest>.*))'
+    r'|(?P<code_heading>\*\*Code Example\*\*:.*)'
+    r'|(?P<fence>[ \t]*```(?P<language>.*)(?P<code>(?s:.*?))'
+    r'(?:\n(?P<fence_close>[ \t]*```.*)|(?=\n(?:## Section \d+: |### ☐ ))|\Z))'
+    r'|(?P<rule>[ \t]*---[ \t]*)'
+    r')$',
+    re.MULTILINE
+)
+_RE_HR = re.compile(r'^\s*---\s*$', re.MULTILINE)
+_RE_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_CODE = re.compile(r'`([^`]+)`')
+# Markdown line classes for _markdown_to_html ([^\S\n] is whitespace other
+# than a newline, so patterns never run across lines)
+_RE_PARAGRAPH = re.compile(r'^(?![-*][^\S\n])([^\S\n]*\S.*)$', re.MULTILINE)
+_RE_BULLET_BLOCK = re.compile(r'^[-*][^\S\n]+.*(?:\n[-*][^\S\n]+.*)*', re.MULTILINE)
+_RE_BULLET_ITEM = re.compile(r'^[-*][^\S\n]+(.*)$', re.MULTILINE)
+_RE_BLANK_LINE = re.compile(r'^[^\S\n]*(?:\n|\Z)', re.MULTILINE)
+_RE_PRE = re.compile(r'<pre>(.*?)</pre>', re.DOTALL)
+
+
+# Minimum number of distinct code blocks before highlighting is spread across
+# worker processes (see HTMLGenerator.prime_highlight_cache)
+PARALLEL_HIGHLIGHT_MIN_BLOCKS = 64
+
+
+highlight = DartLexer = get_lexer_by_name = HtmlFormatter = None
+
+
+def _ensure_pygments():
+    """Import the Pygments highlighting API (lexers, formatter) on first use."""
+    global highlight, DartLexer, get_lexer_by_name, HtmlFormatter
+    if HtmlFormatter is None:
+        from pygments import highlight
+        from pygments.lexers import DartLexer, get_lexer_by_name
+        from pygments.formatters import HtmlFormatter
+
+
+def _create_formatter():
+    """Create the Pygments HTML formatter used for all code examples."""
+    _ensure_pygments()
+    return HtmlFormatter(
+        style='monokai',  # Dark theme compatible
+        noclasses=False,  # Use CSS classes
+        cssclass='highlight',
+        prestyles='',
+    )
+
+
+# Lexers by lowercase language name; building one compiles its token tables,
+# and a lexer can be reused for any number of highlight() calls
+_lexers: Dict[str, object] = {}
+
+
+def _get_lexer(language: str):
+    """Return the (cached) Pygments lexer for a language identifier."""
+    language = language.lower()
+    lexer = _lexers.get(language)
+    if lexer is None:
+        if language == 'dart':
+            lexer = DartLexer()
+        else:
+            # Fallback for other languages
+            lexer = get_lexer_by_name(language, stripall=False)
+        _lexers[language] = lexer
+    return lexer
+
+
+def _highlight_block(code: str, language: str, formatter) -> str:
+    """
+    Apply syntax highlighting to a code block with the given formatter.
+
+    Returns the inner <pre> content, or HTML-escaped code if highlighting fails.
+    """
+    try:
+        _ensure_pygments()
+
+        # Get appropriate lexer for language
+        lexer = _get_lexer(language)
+
+        # Apply highlighting
+        highlighted = highlight(code, lexer, formatter)
+
+        # Extract just the <pre> content (remove wrapper div)
+        # Pygments wraps in <div class="highlight"><pre>...</pre></div>
+        # We want only the inner content since we have our own <pre> wrapper
+        match = _RE_PRE.search(highlighted)
+        if match:
+            return match.group(1)
+        else:
+            return highlighted
+
+    except Exception as e:
+        # Fallback on error: return HTML-escaped code
+        print(f"⚠️  Warning: Syntax highlighting failed for {language}: {e}")
+        return html.escape(code, quote=False)
+
+
+# Formatter owned by a worker process, created on its first task
+_worker_formatter = None
+
+
+def _highlight_worker(code: str, language: str) -> str:
+    """Highlight a code block inside a ProcessPoolExecutor worker."""
+    global _worker_formatter
+    if _worker_formatter is None:
+        _worker_formatter = _create_formatter()
+    return _highlight_block(code, language, _worker_formatter)
+
+
+def _code_span_to_html(match) -> str:
+    """Render an inline `code` span as <code>, escaping HTML characters."""
+    return f'<code>{html.escape(match.group(1), quote=False)}</code>'
+
+
+def _bullet_block_to_html(match) -> str:
+    """Render a run of consecutive bullet lines as a <ul> list."""
+    items = _RE_BULLET_ITEM.sub(r'<li>\1</li>', match.group(0))
+    return f'<ul>\n{items}\n</ul>'
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, using orjson when installed.
+
+    The result is embedded as a JavaScript literal, so indentation only adds
+    size. Both paths produce identical output; orjson's bytes are returned
+    as is, since they are only ever written out.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 @dataclass
 class CodeExample:
@@ -55,6 +217,17 @@ class Section:
     items: List[ChecklistItem]
 
 
+@dataclass
+class RenderedChecklist:
+    """Parsed and highlighted checklist content, cached between builds."""
+    section_count: int
+    item_count: int
+    sections_html: str
+    en_content: Dict[str, List[str]]  # English items, What/Why HTML and code examples
+    ja_code_examples: Optional[List[str]]  # None without code-translations.json
+    pygments_css: str
+
+
 class MarkdownParser:
     """Parse Markdown checklist into structured data."""
 
@@ -63,119 +236,82 @@ class MarkdownParser:
         self.content = markdown_path.read_text(encoding='utf-8')
 
     def parse(self) -> List[Section]:
-        """Parse Markdown file into Section objects."""
-        sections = []
-        lines = self.content.split('\n')
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Match section header: ## Section N: Title
-            section_match = re.match(r'^## Section (\d+): (.+)$', line)
-            if section_match:
-                section_num = int(section_match.group(1))
-                section_title = section_match.group(2).strip()
-                i += 1
-
-                # Parse items in this section
-                items = []
-                while i < len(lines):
-                    # Check if we've hit the next section
-                    if re.match(r'^## Section \d+:', lines[i]):
-                        break
-
-                    # Match checklist item: ### ☐ Title
-                    item_match = re.match(r'^### ☐ (.+)$', lines[i])
-                    if item_match:
-                        item_title = item_match.group(1).strip()
-                        i += 1
-
-                        # Parse item details
-                        item = self._parse_item_details(lines, i, item_title)
-                        items.append(item)
-
-                        # Skip to next item/section (already advanced by _parse_item_details)
-                        continue
-
-                    i += 1
-
-                sections.append(Section(number=section_num, title=section_title, items=items))
-                continue
-
-            i += 1
-
-        return sections
+        """
+        Parse Markdown file into Section objects.
 
-    def _parse_item_details(self, lines: List[str], start_index: int, title: str) -> ChecklistItem:
-        """Parse the details of a checklist item."""
-        what_this_means = []
-        why_this_matters = []
+        Walks the document once with _RE_TOKEN. Text between two tokens is
+        content for whichever "What this means" / "Why this matters" block is
+        currently open; everything else is decided by the token kind.
+        """
+        content = self.content
+        sections = []
+        items: Optional[List[ChecklistItem]] = None  # None until the first section
+        title: Optional[str] = None  # None when no item is open
+        what_this_means: List[str] = []
+        why_this_matters: List[str] = []
+        target: Optional[List[str]] = None  # block receiving content lines
         code_example = None
-        current_section = None
-        i = start_index
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Stop at next item or section
-            if re.match(r'^###? ', line):
-                break
-
-            # Match "What this means:" heading
-            if re.match(r'^\*\*What this means:\*\*', line):
-                current_section = 'what'
-                # Extract content after the heading
-                content_after = re.sub(r'^\*\*What this means:\*\* ', '', line)
-                if content_after:
-                    what_this_means.append(content_after)
-                i += 1
+        pos = 0
+
+        for match in _RE_TOKEN.finditer(content):
+            if target is not None:
+                target.extend(line for line in content[pos:match.start()].split('\n') if line.strip())
+            pos = match.end()
+            kind = match.lastgroup
+
+            if kind == 'fence' and match.group('fence_close') is None:
+                line_number = content.count('\n', 0, match.start()) + 1
+                print(f"⚠️  Warning: Unterminated code fence at line {line_number} of "
+                      f"{self.markdown_path.name} (ended before the next header)")
+
+            # Any section, item or other h2/h3 heading ends the open item
+            if kind in ('section', 'item', 'heading'):
+                if title is not None:
+                    items.append(self._build_item(title, what_this_means, why_this_matters, code_example))
+                title = None
+                target = None
+
+            if kind == 'section':
+                items = []
+                sections.append(Section(
+                    number=int(match.group('section_num')),
+                    title=match.group('section_title').strip(),
+                    items=items
+                ))
+            elif kind == 'item':
+                if items is not None:
+                    title = match.group('item_title').strip()
+                    what_this_means, why_this_matters, code_example = [], [], None
+            elif title is None:
+                # What/Why/Code/rule tokens outside an item carry no content
                 continue
-
-            # Match "Why this matters:" heading
-            if re.match(r'^\*\*Why this matters:\*\*', line):
-                current_section = 'why'
-                # Extract content after the heading
-                content_after = re.sub(r'^\*\*Why this matters:\*\* ', '', line)
+            elif kind in ('what', 'why'):
+                target = what_this_means if kind == 'what' else why_this_matters
+                # Keep content after the heading ("**What this means:** text")
+                rest = match.group(kind + '_rest')
+                content_after = rest[1:] if rest.startswith(' ') else match.group(0)
                 if content_after:
-                    why_this_matters.append(content_after)
-                i += 1
-                continue
-
-            # Match "Code Example:" heading
-            if re.match(r'^\*\*Code Example\*\*:', line):
-                current_section = 'code'
-                i += 1
-                continue
-
-            # Match code block start
-            if line.strip().startswith('```'):
-                language = line.strip()[3:].strip() or 'dart'
-                code_lines = []
-                i += 1
-
-                # Collect code lines until closing ```
-                while i < len(lines) and not lines[i].strip().startswith('```'):
-                    code_lines.append(lines[i])
-                    i += 1
-
-                code_example = CodeExample(language=language, code='\n'.join(code_lines))
-                i += 1  # Skip closing ```
-                continue
-
-            # Skip horizontal rules (Markdown: ---)
-            if line.strip() == '---':
-                i += 1
-                continue
-
-            # Add content to appropriate section
-            if current_section == 'what' and line.strip():
-                what_this_means.append(line)
-            elif current_section == 'why' and line.strip():
-                why_this_matters.append(line)
+                    target.append(content_after)
+            elif kind == 'code_heading':
+                target = None
+            elif kind == 'fence':
+                # The code runs from the end of the opening line
+                code = match.group('code')[1:]
+                if code.endswith('\n'):
+                    code = code[:-1]
+                language = match.group('language').strip() or 'dart'
+                code_example = CodeExample(language=language, code=code)
+
+        if target is not None:
+            target.extend(line for line in content[pos:].split('\n') if line.strip())
+        if title is not None:
+            items.append(self._build_item(title, what_this_means, why_this_matters, code_example))
 
-            i += 1
+        return sections
 
+    def _build_item(self, title: str, what_this_means: List[str], why_this_matters: List[str],
+                    code_example: Optional[CodeExample]) -> ChecklistItem:
+        """Build a checklist item from its collected content lines."""
         # Convert lists to formatted HTML
         what_html = self._markdown_to_html('\n'.join(what_this_means))
         why_html = self._markdown_to_html('\n'.join(why_this_matters))
@@ -194,48 +330,22 @@ class MarkdownParser:
 
         # Convert horizontal rules (---) to <hr> tags
         # This is a defensive measure; horizontal rules should already be filtered out
-        text = re.sub(r'^\s*---\s*$', '<hr>', text, flags=re.MULTILINE)
+        text = _RE_HR.sub('<hr>', text)
 
         # Convert **bold** to <strong>
-        text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', text)
+        text = _RE_BOLD.sub(r'<strong>\1</strong>', text)
 
         # Convert `code` to <code> with HTML escaping
-        def escape_code(match):
-            code_content = match.group(1)
-            # Escape HTML characters inside code
-            escaped = (code_content
-                      .replace('&', '&amp;')
-                      .replace('<', '&lt;')
-                      .replace('>', '&gt;'))
-            return f'<code>{escaped}</code>'
-
-        text = re.sub(r'`([^`]+)`', escape_code, text)
-
-        # Convert bullet lists
-        lines = text.split('\n')
-        html_lines = []
-        in_list = False
-
-        for line in lines:
-            # Check for bullet point
-            if re.match(r'^[-*]\s+', line):
-                if not in_list:
-                    html_lines.append('<ul>')
-                    in_list = True
-                # Remove bullet marker and wrap in <li>
-                content = re.sub(r'^[-*]\s+', '', line)
-                html_lines.append(f'<li>{content}</li>')
-            else:
-                if in_list:
-                    html_lines.append('</ul>')
-                    in_list = False
-                if line.strip():
-                    html_lines.append(f'<p>{line}</p>')
+        text = _RE_CODE.sub(_code_span_to_html, text)
 
-        if in_list:
-            html_lines.append('</ul>')
+        # Wrap non-bullet lines in <p>, then each run of bullet lines in <ul>
+        # (most blocks have no bullets: a substring probe skips the list pass)
+        text = _RE_PARAGRAPH.sub(r'<p>\1</p>', text)
+        if text.startswith(('-', '*')) or '\n-' in text or '\n*' in text:
+            text = _RE_BULLET_BLOCK.sub(_bullet_block_to_html, text)
 
-        return '\n'.join(html_lines)
+        # Drop blank lines (they only separate blocks)
+        return _RE_BLANK_LINE.sub('', text).rstrip('\n')
 
 
 class HTMLGenerator:
@@ -243,15 +353,13 @@ class HTMLGenerator:
 
     def __init__(self, sections: List[Section]):
         self.sections = sections
+        # Highlighted HTML keyed by (code, language); each example is rendered
+        # for the sections HTML and again for the translations payload
+        self._highlight_cache: Dict[Tuple[str, str], str] = {}
 
         # Configure Pygments formatter for syntax highlighting
         if PYGMENTS_AVAILABLE:
-            self.code_formatter = HtmlFormatter(
-                style='monokai',  # Dark theme compatible
-                noclasses=False,  # Use CSS classes
-                cssclass='highlight',
-                prestyles='',
-            )
+            self.code_formatter = _create_formatter()
             self.pygments_css = self.code_formatter.get_style_defs('.highlight')
         else:
             self.code_formatter = None
@@ -259,34 +367,43 @@ class HTMLGenerator:
 
     def generate_sections_html(self) -> str:
         """Generate HTML for all sections."""
-        html_parts = []
+        # Sections and items append their fragments to one list that is joined
+        # once, instead of building a string per item and per section
+        parts: List[str] = []
 
-        for section in self.sections:
-            section_html = self._generate_section_html(section)
-            html_parts.append(section_html)
+        for idx, section in enumerate(self.sections):
+            if idx:
+                parts.append('\n')
+            self._append_section_html(parts, section)
 
-        return '\n'.join(html_parts)
+        return ''.join(parts)
 
-    def _generate_section_html(self, section: Section) -> str:
-        """Generate HTML for a single section."""
+    def _append_section_html(self, parts: List[str], section: Section):
+        """Append the HTML fragments for a single section to parts."""
         section_id = f"section-{section.number}"
 
+        parts += (
+            '\n'
+            '    <div class="section" id="', section_id, '">\n'
+            '      <div class="section-header" onclick="toggleSection(\'', section_id, '\')">\n'
+            '        <h2 class="section-title"><span class="section-number">Section ', str(section.number),
+            ':</span> ', section.title, '</h2>\n'
+            '        <span class="section-toggle">▼</span>\n'
+            '      </div>\n'
+            '      <div class="section-content">\n',
+        )
+
         # Generate items HTML
-        items_html = '\n'.join([
-            self._generate_item_html(section.number, idx, item)
-            for idx, item in enumerate(section.items)
-        ])
-
-        return f'''
-    <div class="section" id="{section_id}">
-      <div class="section-header" onclick="toggleSection('{section_id}')">
-        <h2 class="section-title"><span class="section-number">Section {section.number}:</span> {section.title}</h2>
-        <span class="section-toggle">▼</span>
-      </div>
-      <div class="section-content">
-{items_html}
-      </div>
-    </div>'''
+        for idx, item in enumerate(section.items):
+            if idx:
+                parts.append('\n')
+            self._append_item_html(parts, section.number, idx, item)
+
+        parts.append(
+            '\n'
+            '      </div>\n'
+            '    </div>'
+        )
 
     def _highlight_code(self, code: str, language: str) -> str:
         """
@@ -299,38 +416,75 @@ class HTMLGenerator:
         Returns:
             HTML string with syntax highlighting markup
         """
+        key = (code, language)
+        highlighted = self._highlight_cache.get(key)
+        if highlighted is None:
+            highlighted = self._render_highlighted(code, language)
+            self._highlight_cache[key] = highlighted
+        return highlighted
+
+    def _render_highlighted(self, code: str, language: str) -> str:
+        """Run Pygments over a code block (uncached, see _highlight_code)."""
+        if not self.code_formatter:
+            # Highlighting unavailable or disabled: HTML escape only
+            return html.escape(code, quote=False)
+        return _highlight_block(code, language, self.code_formatter)
+
+    def prime_highlight_cache(self, blocks: List[Tuple[str, str]]):
+        """
+        Highlight (code, language) blocks ahead of time.
+
+        Large batches are spread across worker processes; Pygments is pure
+        Python, so a single process is bound to one core. Small batches are
+        left to be highlighted lazily, since starting the pool would cost
+        more than it saves.
+        """
+        pending = list(dict.fromkeys(block for block in blocks if block not in self._highlight_cache))
+        if (not PYGMENTS_AVAILABLE
+                or len(pending) < PARALLEL_HIGHLIGHT_MIN_BLOCKS
+                or (os.cpu_count() or 1) < 2):
+            return
+
+        codes, languages = zip(*pending)
         try:
-            # Get appropriate lexer for language
-            if language.lower() == 'dart':
-                lexer = DartLexer()
-            else:
-                # Fallback for other languages
-                lexer = get_lexer_by_name(language.lower(), stripall=False)
-
-            # Apply highlighting
-            highlighted = highlight(code, lexer, self.code_formatter)
-
-            # Extract just the <pre> content (remove wrapper div)
-            # Pygments wraps in <div class="highlight"><pre>...</pre></div>
-            # We want only the inner content since we have our own <pre> wrapper
-            match = re.search(r'<pre>(.*?)</pre>', highlighted, re.DOTALL)
-            if match:
-                return match.group(1)
-            else:
-                return highlighted
-
-        except Exception as e:
-            # Fallback on error: return HTML-escaped code
-            print(f"⚠️  Warning: Syntax highlighting failed for {language}: {e}")
-            return (code
-                    .replace('&', '&amp;')
-                    .replace('<', '&lt;')
-                    .replace('>', '&gt;'))
-
-    def _generate_item_html(self, section_num: int, item_idx: int, item: ChecklistItem) -> str:
-        """Generate HTML for a single checklist item."""
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_highlight_worker, codes, languages, chunksize=8))
+        except (OSError, BrokenProcessPool) as e:
+            # Fall back to highlighting lazily in this process
+            print(f"⚠️  Warning: Parallel highlighting unavailable: {e}")
+            return
+
+        self._highlight_cache.update(zip(pending, results))
+
+    def _append_item_html(self, parts: List[str], section_num: int, item_idx: int, item: ChecklistItem):
+        """Append the HTML fragments for a single checklist item to parts."""
         checkbox_id = f"item-{section_num}-{item_idx}"
-        code_html = ''
+
+        parts += (
+            '\n'
+            '        <div class="item">\n'
+            '          <div class="item-header">\n'
+            '            <div class="checkbox-wrapper">\n'
+            '              <input type="checkbox" class="item-checkbox" id="', checkbox_id, '">\n'
+            '            </div>\n'
+            '            <div class="item-title">', item.title, '</div>\n'
+            '          </div>\n'
+            '          <div class="item-details">\n'
+            '            <div class="detail-section">\n'
+            '              <div class="detail-heading">What this means:</div>\n'
+            '              <div class="detail-content">\n',
+            item.what_this_means,
+            '\n'
+            '              </div>\n'
+            '            </div>\n'
+            '            <div class="detail-section">\n'
+            '              <div class="detail-heading">Why this matters:</div>\n'
+            '              <div class="detail-content">\n',
+            item.why_this_matters,
+            '\n'
+            '              </div>\n'
+            '            </div>',
+        )
 
         if item.code_example:
             code_id = f"code-{section_num}-{item_idx}"
@@ -343,156 +497,121 @@ class HTMLGenerator:
                 )
             else:
                 # Fallback: HTML escape only
-                highlighted_code = (item.code_example.code
-                                   .replace('&', '&amp;')
-                                   .replace('<', '&lt;')
-                                   .replace('>', '&gt;'))
-
-            code_html = f'''
-        <div class="code-example">
-          <div class="code-header">
-            <span class="code-label">Code Example ({item.code_example.language})</span>
-            <button class="code-toggle" onclick="toggleCode('{code_id}')">Show Code</button>
-          </div>
-          <div class="code-content hidden" id="{code_id}">
-            <pre><code class="highlight">{highlighted_code}</code></pre>
-          </div>
-        </div>'''
-
-        return f'''
-        <div class="item">
-          <div class="item-header">
-            <div class="checkbox-wrapper">
-              <input type="checkbox" class="item-checkbox" id="{checkbox_id}">
-            </div>
-            <div class="item-title">{item.title}</div>
-          </div>
-          <div class="item-details">
-            <div class="detail-section">
-              <div class="detail-heading">What this means:</div>
-              <div class="detail-content">
-{item.what_this_means}
-              </div>
-            </div>
-            <div class="detail-section">
-              <div class="detail-heading">Why this matters:</div>
-              <div class="detail-content">
-{item.why_this_matters}
-              </div>
-            </div>{code_html}
-          </div>
-        </div>'''
+                highlighted_code = html.escape(item.code_example.code, quote=False)
+
+            parts += (
+                '\n'
+                '        <div class="code-example">\n'
+                '          <div class="code-header">\n'
+                '            <span class="code-label">Code Example (', item.code_example.language, ')</span>\n'
+                '            <button class="code-toggle" onclick="toggleCode(\'', code_id, '\')">Show Code</button>\n'
+                '          </div>\n'
+                '          <div class="code-content hidden" id="', code_id, '">\n'
+                '            <pre><code class="highlight">', highlighted_code, '</code></pre>\n'
+                '          </div>\n'
+                '        </div>',
+            )
+
+        parts.append(
+            '\n'
+            '          </div>\n'
+            '        </div>'
+        )
 
 
 class ChecklistBuilder:
     """Main builder orchestrating parsing, generation, and output."""
 
-    def __init__(self, base_dir: Path):
+    # Injection points in template.html
+    TRANSLATIONS_MARKER = '/* INJECT_TRANSLATIONS_HERE */'
+    SECTIONS_MARKER = '<!-- Pre-rendered sections will be injected here by build script -->'
+    STYLE_END_MARKER = '</style>'
+
+    def __init__(self, base_dir: Path, quiet: bool = False):
         self.base_dir = base_dir
         self.markdown_path = base_dir / 'ditto-implementation-checklist.md'
         self.translations_path = base_dir / 'translations.json'
         self.template_path = base_dir / 'template.html'
         self.output_path = base_dir / 'ditto-sdk-checklist.html'
+        self.code_translations_path = base_dir / 'code-translations.json'
+        self.cache_dir = base_dir / '.build-cache'
+        self.quiet = quiet
+        self._log_lines: List[str] = []
 
     def build(self):
         """Execute the full build process."""
-        print(f"🔨 Building Ditto SDK Checklist HTML...")
-        print(f"  📄 Markdown source: {self.markdown_path.name}")
-        print(f"  🌐 Translations: {self.translations_path.name}")
-        print(f"  📋 Template: {self.template_path.name}")
-        print()
-
-        # Step 1: Parse Markdown
-        print("1️⃣  Parsing Markdown...")
-        parser = MarkdownParser(self.markdown_path)
-        sections = parser.parse()
-        print(f"   ✓ Parsed {len(sections)} sections with {sum(len(s.items) for s in sections)} items")
-
-        # Step 2: Load translations
-        print("2️⃣  Loading translations...")
+        try:
+            self._run_steps()
+        finally:
+            self._flush_log()
+
+    def _run_steps(self):
+        """Run the numbered build steps, buffering progress output."""
+        self._log(f"🔨 Building Ditto SDK Checklist HTML...")
+        self._log(f"  📄 Markdown source: {self.markdown_path.name}")
+        self._log(f"  🌐 Translations: {self.translations_path.name}")
+        self._log(f"  📋 Template: {self.template_path.name}")
+        self._log()
+
+        # Step 1: Load translations
+        self._log("1️⃣  Loading translations...")
         with self.translations_path.open('r', encoding='utf-8') as f:
             translations = json.load(f)
-        print(f"   ✓ Loaded translations for {len(translations)} languages")
+        self._log(f"   ✓ Loaded translations for {len(translations)} languages")
 
-        # Step 3: Generate HTML sections
-        print("3️⃣  Generating HTML sections...")
-        generator = HTMLGenerator(sections)
-        sections_html = generator.generate_sections_html()
-        print(f"   ✓ Generated {len(sections_html)} characters of HTML")
+        # Japanese code examples are only rendered when there is a 'ja' language
+        with_japanese = 'ja' in translations
+
+        # Reuse the parse + highlight results when no input has changed
+        cache_path = self.cache_dir / f'{self._cache_key(with_japanese)}.json'
+        rendered = self._load_cached_render(cache_path)
 
-        # Step 4: Load template
-        print("4️⃣  Loading template...")
-        template_content = self.template_path.read_text(encoding='utf-8')
-        print(f"   ✓ Loaded template ({len(template_content)} characters)")
+        # Step 2: Parse Markdown
+        self._log("2️⃣  Parsing Markdown...")
+        if rendered:
+            self._log(f"   ✓ Sources unchanged, using cached render "
+                      f"({rendered.section_count} sections with {rendered.item_count} items)")
+        else:
+            # Emit progress so far before parsing, which may print warnings
+            self._flush_log()
+            parser = MarkdownParser(self.markdown_path)
+            sections = parser.parse()
+            self._log(f"   ✓ Parsed {len(sections)} sections with {sum(len(s.items) for s in sections)} items")
+
+        # Step 3: Generate HTML sections
+        self._log("3️⃣  Generating HTML sections...")
+        if not rendered:
+            # Emit progress so far before rendering, which may print warnings
+            self._flush_log()
+            rendered = self._render(sections, with_japanese)
+            self._save_cached_render(cache_path, rendered)
+        sections_html = rendered.sections_html
+        self._log(f"   ✓ Generated {len(sections_html)} characters of HTML")
+
+        # Step 4: Load template (mapped and streamed in step 6)
+        self._log("4️⃣  Loading template...")
+        self._log(f"   ✓ Found template ({self.template_path.stat().st_size:,} bytes)")
 
         # Step 5: Inject translations and sections
-        print("5️⃣  Injecting translations and sections...")
+        self._log("5️⃣  Injecting translations and sections...")
 
         # Add English content arrays to translations for language switching
-        en_items = []
-        en_what_means_sections = []
-        en_why_matters_sections = []
-        en_code_examples = []
+        translations['en'].update(rendered.en_content)
 
-        # Collect all code examples (only items with code)
-        for section in sections:
-            for item in section.items:
-                en_items.append(item.title)
-                en_what_means_sections.append(item.what_this_means)
-                en_why_matters_sections.append(item.why_this_matters)
-                if item.code_example:
-                    # Store syntax-highlighted HTML for English code
-                    highlighted = generator._highlight_code(item.code_example.code, item.code_example.language)
-                    en_code_examples.append(highlighted)
-
-        translations['en']['items'] = en_items
-        translations['en']['whatMeansSections'] = en_what_means_sections
-        translations['en']['whyMattersSections'] = en_why_matters_sections
-        translations['en']['codeExamples'] = en_code_examples
-
-        # Load Japanese code translations and apply syntax highlighting
-        code_translations_path = self.base_dir / 'code-translations.json'
-        if code_translations_path.exists():
-            with open(code_translations_path, 'r', encoding='utf-8') as f:
-                code_translations = json.load(f)
-                ja_code_examples = []
-                code_idx = 0
-
-                for section in sections:
-                    for item in section.items:
-                        if item.code_example:
-                            # Find matching translation by index
-                            translated = next(
-                                (block['translatedCode'] for block in code_translations['codeBlocks']
-                                 if block['index'] == code_idx),
-                                None
-                            )
-                            if translated:
-                                # Apply syntax highlighting to translated code
-                                highlighted = generator._highlight_code(translated, item.code_example.language)
-                                ja_code_examples.append(highlighted)
-                            else:
-                                # Fallback to English code
-                                highlighted = generator._highlight_code(item.code_example.code, item.code_example.language)
-                                ja_code_examples.append(highlighted)
-                            code_idx += 1
-
-                if 'ja' in translations:
-                    translations['ja']['codeExamples'] = ja_code_examples
-
-        print(f"   ✓ Generated {len(en_code_examples)} English code examples")
-        print(f"   ✓ Generated {len(translations.get('ja', {}).get('codeExamples', []))} Japanese code examples")
-
-        translations_json = json.dumps(translations, ensure_ascii=False, indent=2)
+        if rendered.ja_code_examples is not None:
+            translations['ja']['codeExamples'] = rendered.ja_code_examples
+
+        self._log(f"   ✓ Generated {len(rendered.en_content['codeExamples'])} English code examples")
+        self._log(f"   ✓ Generated {len(translations.get('ja', {}).get('codeExamples', []))} Japanese code examples")
 
         # Get Pygments CSS if available
         pygments_css = ''
-        if generator.pygments_css:
+        if rendered.pygments_css:
             pygments_css = f'''
     /* ==========================================================================
        Syntax Highlighting (Pygments)
        ========================================================================== */
-    {generator.pygments_css}
+    {rendered.pygments_css}
 
     /* Adjust Pygments colors to match our dark theme */
     .highlight {{
@@ -505,46 +624,186 @@ class ChecklistBuilder:
     }}
     '''
 
-        output_html = template_content.replace(
-            '/* INJECT_TRANSLATIONS_HERE */',
-            translations_json
-        )
-        output_html = output_html.replace(
-            '<!-- Pre-rendered sections will be injected here by build script -->',
-            sections_html
-        )
+        # UTF-8 content for each injection point, keyed by the template marker
+        injections = {
+            self.TRANSLATIONS_MARKER: _json_dumps(translations),
+            self.SECTIONS_MARKER: sections_html.encode('utf-8'),
+        }
 
         # Inject Pygments CSS before closing </style>
         if pygments_css:
-            output_html = output_html.replace(
-                '</style>',
-                f'{pygments_css}\n  </style>'
-            )
+            injections[self.STYLE_END_MARKER] = f'{pygments_css}\n  </style>'.encode('utf-8')
 
-        print("   ✓ Injection complete")
+        self._log("   ✓ Injection complete")
 
         # Step 6: Write output
-        print("6️⃣  Writing output file...")
-        self.output_path.write_text(output_html, encoding='utf-8')
-        print(f"   ✓ Written to: {self.output_path}")
+        self._log("6️⃣  Writing output file...")
+        self._write_output(injections)
+        self._log(f"   ✓ Written to: {self.output_path}")
 
         # Summary
-        print()
-        print("✅ Build complete!")
-        print(f"   📊 Output size: {len(output_html):,} characters")
-        print(f"   📦 Output file: {self.output_path.name}")
-        print()
-        print("Next steps:")
-        print("  1. Validate: python validate-html-tags.py")
-        print("  2. Open in browser: open ditto-sdk-checklist.html")
+        self._log()
+        self._log("✅ Build complete!")
+        self._log(f"   📊 Output size: {self.output_path.stat().st_size:,} bytes")
+        self._log(f"   📦 Output file: {self.output_path.name}")
+        self._log()
+        self._log("Next steps:")
+        self._log("  1. Validate: python validate-html-tags.py")
+        self._log("  2. Open in browser: open ditto-sdk-checklist.html")
+
+    def _log(self, message: str = ''):
+        """Buffer a progress line; buffered lines are written out by _flush_log."""
+        if not self.quiet:
+            self._log_lines.append(message)
+
+    def _flush_log(self):
+        """Write buffered progress lines to stdout in a single call."""
+        if self._log_lines:
+            sys.stdout.write('\n'.join(self._log_lines) + '\n')
+            sys.stdout.flush()
+            self._log_lines.clear()
+
+    def _render(self, sections: List[Section], with_japanese: bool) -> RenderedChecklist:
+        """Generate the sections HTML and highlighted content for the translations."""
+        # Collect English content and code blocks in a single pass over the items
+        en_items = []
+        en_what_means_sections = []
+        en_why_matters_sections = []
+        en_code_blocks = []  # (code, language) for items with a code example
+
+        for section in sections:
+            for item in section.items:
+                en_items.append(item.title)
+                en_what_means_sections.append(item.what_this_means)
+                en_why_matters_sections.append(item.why_this_matters)
+                if item.code_example:
+                    en_code_blocks.append((item.code_example.code, item.code_example.language))
+
+        # Pair each code block with its Japanese translation, falling back to
+        # the English code (skipped when there is no Japanese language or
+        # nothing to translate)
+        ja_code_blocks = None
+        if with_japanese and en_code_blocks and self.code_translations_path.exists():
+            with open(self.code_translations_path, 'r', encoding='utf-8') as f:
+                code_translations = json.load(f)
+            translated_by_idx = {
+                block['index']: block['translatedCode']
+                for block in code_translations['codeBlocks']
+            }
+            ja_code_blocks = [
+                (translated_by_idx.get(code_idx) or code, language)
+                for code_idx, (code, language) in enumerate(en_code_blocks)
+            ]
+
+        generator = HTMLGenerator(sections)
+        generator.prime_highlight_cache(en_code_blocks + (ja_code_blocks or []))
+
+        sections_html = generator.generate_sections_html()
+
+        # Syntax-highlighted HTML for the code examples (served from the cache)
+        en_code_examples = [generator._highlight_code(code, language) for code, language in en_code_blocks]
+        ja_code_examples = None
+        if ja_code_blocks is not None:
+            ja_code_examples = [generator._highlight_code(code, language) for code, language in ja_code_blocks]
+
+        return RenderedChecklist(
+            section_count=len(sections),
+            item_count=len(en_items),
+            sections_html=sections_html,
+            en_content={
+                'items': en_items,
+                'whatMeansSections': en_what_means_sections,
+                'whyMattersSections': en_why_matters_sections,
+                'codeExamples': en_code_examples,
+            },
+            ja_code_examples=ja_code_examples,
+            pygments_css=generator.pygments_css or '',
+        )
+
+    def _cache_key(self, with_japanese: bool) -> str:
+        """
+        Hash every input of _render(): the Markdown source, the code
+        translations (if used), this script and the Pygments version.
+        """
+        paths = [self.markdown_path, Path(__file__)]
+        if with_japanese:
+            paths.append(self.code_translations_path)
+
+        digest = hashlib.sha256(b'ja' if with_japanese else b'en')
+        for path in paths:
+            digest.update(path.read_bytes() if path.exists() else b'')
+            digest.update(b'\0')
+        digest.update((PYGMENTS_VERSION if PYGMENTS_AVAILABLE else 'no-pygments').encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_cached_render(self, cache_path: Path) -> Optional[RenderedChecklist]:
+        """Load a cached render, or None if it is missing or unreadable."""
+        try:
+            with cache_path.open('r', encoding='utf-8') as f:
+                return RenderedChecklist(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_cached_render(self, cache_path: Path, rendered: RenderedChecklist):
+        """Store a render as the only cache entry (older entries are stale)."""
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            for stale in self.cache_dir.glob('*.json'):
+                stale.unlink()
+            cache_path.write_bytes(_json_dumps(asdict(rendered)))
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write build cache: {e}")
+
+    def _write_output(self, injections: Dict[str, bytes]):
+        """
+        Stream template.html to the output file, filling each injection point.
+
+        The template is memory-mapped and copied slice by slice between the
+        markers (in document order), so it is never decoded or copied as a
+        whole the way chained str.replace() calls would.
+        """
+        encoded = {marker.encode('utf-8'): content for marker, content in injections.items()}
+
+        with self.template_path.open('rb') as template, \
+                self.output_path.open('wb') as out:
+            # An empty file cannot be mapped; it has no markers, so the output is empty
+            if os.fstat(template.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(template.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                    memoryview(mapped) as view:
+                positions = sorted(
+                    (index, marker)
+                    for index, marker in ((mapped.find(marker), marker) for marker in encoded)
+                    if index >= 0
+                )
+
+                pos = 0
+                for index, marker in positions:
+                    out.write(view[pos:index])
+                    out.write(encoded[marker])
+                    pos = index + len(marker)
+                out.write(view[pos:])
 
 
 def main():
     """Main entry point."""
+    global PYGMENTS_AVAILABLE
+
+    arg_parser = argparse.ArgumentParser(description='Build the Ditto SDK checklist HTML.')
+    arg_parser.add_argument('--no-highlight', action='store_true',
+                            help='skip syntax highlighting (faster builds while iterating)')
+    arg_parser.add_argument('-q', '--quiet', action='store_true',
+                            help='suppress progress output (warnings and errors are still shown)')
+    args = arg_parser.parse_args()
+
+    if args.no_highlight:
+        PYGMENTS_AVAILABLE = False
+
     script_dir = Path(__file__).parent
 
     try:
-        builder = ChecklistBuilder(script_dir)
+        builder = ChecklistBuilder(script_dir, quiet=args.quiet)
         builder.build()
         return 0
     except Exception as e:
@@ -2,14 +2,67 @@
 """
 Extract translations from ditto-sdk-checklist.html to translations.json
 
-This script parses the JavaScript object embedded in the HTML file
-and converts it to a clean JSON structure.
+This script locates the JavaScript object embedded in the HTML file,
+parses it (with json5 when it is not plain JSON) and converts it to a clean
+JSON structure.
 """
 
 import json
 import re
 from pathlib import Path
 
+try:
+    import json5
+except ImportError:
+    json5 = None
+
+LANGUAGES = ('en', 'ja')
+STRING_FIELDS = ('title', 'completed', 'showCode', 'hideCode', 'officialDoc', 'whatMeans', 'whyMatters')
+# Array fields extracted per language (English content is generated from Markdown)
+ARRAY_FIELDS = {
+    'en': ('sections',),
+    'ja': ('sections', 'items', 'whatMeansSections'),
+}
+
+_RE_TRANSLATIONS_START = re.compile(r'const translations = (?=\{)')
+
+# JavaScript tokens that matter when walking an object literal: strings and
+# comments are skipped as a whole so braces inside them are not counted
+_RE_JS_TOKEN = re.compile(
+    r'"(?:[^"\\\n]|\\.)*"'
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r'|`(?P<template>(?:[^`\\]|\\.)*)`'
+    r'|//[^\n]*'
+    r'|/\*.*?\*/'
+    r'|(?P<brace>[{}])',
+    re.DOTALL
+)
+
+
+def _object_literal_to_json5(content: str, start: int) -> str:
+    """
+    Return the object literal starting at ``content[start]`` as JSON5 text.
+
+    Walks the source once to find the matching closing brace. Template
+    literals (not valid JSON5) are rewritten as JSON strings of their raw text.
+    """
+    parts = []
+    pos = start
+    depth = 0
+
+    for match in _RE_JS_TOKEN.finditer(content, start):
+        if match.group('template') is not None:
+            parts.append(content[pos:match.start()])
+            parts.append(json.dumps(match.group('template'), ensure_ascii=False))
+            pos = match.end()
+        elif match.group('brace'):
+            depth += 1 if match.group('brace') == '{' else -1
+            if depth == 0:
+                parts.append(content[pos:match.end()])
+                return ''.join(parts)
+
+    raise ValueError("Unterminated translations object in HTML")
+
 
 def extract_translations(html_path: Path) -> dict:
     """Extract translations object from HTML file."""
@@ -17,63 +70,32 @@ def extract_translations(html_path: Path) -> dict:
 
     # Find the translations object
     # Pattern: const translations = { ... };
-    pattern = r'const translations = \{(.*?)\};'
-    match = re.search(pattern, content, re.DOTALL)
+    match = _RE_TRANSLATIONS_START.search(content)
 
     if not match:
         raise ValueError("Could not find translations object in HTML")
 
-    translations_js = match.group(1)
-
-    # Parse the JavaScript object structure manually
-    # This is a simplified parser for the specific structure
-    translations = {'en': {}, 'ja': {}}
-
-    # Extract each language section
-    for lang in ['en', 'ja']:
-        lang_pattern = rf'{lang}: \{{(.*?)\n      \}}'
-        lang_match = re.search(lang_pattern, translations_js, re.DOTALL)
-
-        if not lang_match:
-            continue
-
-        lang_content = lang_match.group(1)
-
-        # Extract simple string fields
-        for field in ['title', 'completed', 'showCode', 'hideCode', 'officialDoc', 'whatMeans', 'whyMatters']:
-            field_pattern = rf'{field}: "([^"]+)"'
-            field_match = re.search(field_pattern, lang_content)
-            if field_match:
-                translations[lang][field] = field_match.group(1)
-
-        # Extract sections array
-        sections_pattern = r'sections: \[(.*?)\]'
-        sections_match = re.search(sections_pattern, lang_content, re.DOTALL)
-        if sections_match:
-            sections_content = sections_match.group(1)
-            sections = re.findall(r'"([^"]+)"', sections_content)
-            translations[lang]['sections'] = sections
-
-        # Extract items array (if exists for ja)
-        if lang == 'ja':
-            items_pattern = r'items: \[(.*?)\],'
-            items_match = re.search(items_pattern, lang_content, re.DOTALL)
-            if items_match:
-                items_content = items_match.group(1)
-                items = re.findall(r'"([^"]+)"', items_content)
-                translations[lang]['items'] = items
-
-            # Extract whatMeansSections array (template literals)
-            whatmeans_pattern = r'whatMeansSections: \[(.*?)\n        \]'
-            whatmeans_match = re.search(whatmeans_pattern, lang_content, re.DOTALL)
-            if whatmeans_match:
-                whatmeans_content = whatmeans_match.group(1)
-                # Extract template literals
-                whatmeans_sections = []
-                template_literal_pattern = r'`([^`]+)`'
-                for match in re.finditer(template_literal_pattern, whatmeans_content):
-                    whatmeans_sections.append(match.group(1))
-                translations[lang]['whatMeansSections'] = whatmeans_sections
+    literal = _object_literal_to_json5(content, match.end())
+
+    # The literal is usually plain JSON, which json.loads parses far faster;
+    # json5 is only needed for JavaScript-only syntax (comments, unquoted keys...)
+    try:
+        source = json.loads(literal)
+    except json.JSONDecodeError:
+        if json5 is None:
+            raise RuntimeError("json5 is required to parse this translations object. "
+                               "Install with: pip install json5")
+        source = json5.loads(literal)
+
+    # Keep the fields translations.json is made of
+    translations = {}
+    for lang in LANGUAGES:
+        lang_source = source.get(lang, {})
+        translations[lang] = {
+            field: lang_source[field]
+            for field in STRING_FIELDS + ARRAY_FIELDS[lang]
+            if field in lang_source
+        }
 
     return translations
 
@@ -11,12 +11,55 @@ Usage:
     ./validate-html-tags.py
 """
 
+import bisect
+import io
+import mmap
+import os
 import re
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
+# Precompiled patterns (compiled once at import instead of per call). The
+# validators scan the raw UTF-8 bytes of the file, so all patterns are bytes.
+
+# Tokens of the rendered HTML, scanned left to right in one pass: comments and
+# whole <script>/<style> elements are matched as single tokens (the element
+# body is the 'raw_body' group), so only real tags set the 'name' group
+_RE_HTML_TOKEN = re.compile(
+    rb'<!--.*?-->'
+    rb'|<(?P<raw>script|style)[^>]*>(?P<raw_body>.*?)</(?P=raw)>'
+    rb'|<(?P<closing>/?)(?P<name>[a-zA-Z][a-zA-Z0-9]*)[^>]*(?P<self_closing>/?)>',
+    re.DOTALL | re.IGNORECASE
+)
+_RE_NEWLINE = re.compile(rb'\n')
+# html += '...' or html += "..." or html += `...` (each string runs to its
+# own closing quote, skipping escapes), or a // comment line, which matches
+# without setting a group
+_RE_CONCAT = re.compile(
+    rb'^[^\S\n]*//.*'
+    rb'|html[^\S\n]*\+=[^\S\n]*(?:'
+    rb"'([^'\\\n]*(?:\\.[^'\\\n]*)*)'"
+    rb'|"([^"\\\n]*(?:\\.[^"\\\n]*)*)"'
+    rb'|`([^`\\\n]*(?:\\.[^`\\\n]*)*)`)',
+    re.MULTILINE
+)
+# const markdownContent = `...`; - the body runs to the first backtick that is
+# followed by ';' (unrolled, so plain characters are consumed in runs). The
+# body is matched inside a lookahead and re-consumed by backreference, which
+# makes it atomic: when the closing `; is missing the search fails without
+# backtracking through the body.
+_RE_MD_TEMPLATE = re.compile(
+    rb'const markdownContent = `(?=(?P<body>[^`]*(?:`(?!;)[^`]*)*))(?P=body)`;'
+)
+
+# Escaped code block markers expected in the embedded Markdown, and the byte
+# that escapes a backtick
+_ESCAPED_FENCE_OPEN = b'\\`\\`\\`dart'
+_ESCAPED_FENCE_CLOSE = b'\\`\\`\\`'
+_BACKSLASH = ord('\\')
+
 
 @dataclass
 class ValidationResult:
@@ -26,23 +69,69 @@ class ValidationResult:
     warnings: List[str]
 
 
+@dataclass
+class DocumentSections:
+    """The checklist HTML, tokenized once and shared by all validators."""
+    content: bytes
+    newline_offsets: List[int]  # Offset of every newline in content
+    tags: List[re.Match]  # _RE_HTML_TOKEN tag matches outside comments, scripts and styles
+    script_spans: List[Tuple[int, int]]  # (start, end) of each <script> element body
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-based line number of an offset in content."""
+        return bisect.bisect_right(self.newline_offsets, offset) + 1
+
+
+# Tag names by their raw bytes as written in the HTML; each distinct spelling
+# is decoded and lowercased once, and the interned result makes stack
+# comparisons between equal names a pointer check
+_tag_names: Dict[bytes, str] = {}
+
+
+def _tag_name(raw_name: bytes) -> str:
+    """Return the interned, lowercase str for a raw tag name."""
+    name = _tag_names.get(raw_name)
+    if name is None:
+        name = _tag_names[raw_name] = sys.intern(raw_name.decode('ascii').lower())
+    return name
+
+
+def _extract_sections(content: bytes) -> DocumentSections:
+    """Scan the HTML once for tags and script bodies."""
+    tags: List[re.Match] = []
+    script_spans: List[Tuple[int, int]] = []
+
+    for match in _RE_HTML_TOKEN.finditer(content):
+        if match.group('name') is not None:
+            tags.append(match)
+        elif match.group('raw') is not None and match.group('raw').lower() == b'script':
+            script_spans.append(match.span('raw_body'))
+
+    return DocumentSections(
+        content=content,
+        newline_offsets=[match.start() for match in _RE_NEWLINE.finditer(content)],
+        tags=tags,
+        script_spans=script_spans
+    )
+
+
 class HTMLValidator:
     """Validates HTML tag structure in rendered HTML."""
 
     # Self-closing tags that don't need closing tags
-    SELF_CLOSING_TAGS = {
+    SELF_CLOSING_TAGS = frozenset({
         'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
         'link', 'meta', 'param', 'source', 'track', 'wbr'
-    }
+    })
 
     # Tags that can be optionally self-closed or have implicit closing
-    OPTIONAL_CLOSE_TAGS = {
+    OPTIONAL_CLOSE_TAGS = frozenset({
         'li', 'dt', 'dd', 'p', 'rt', 'rp', 'optgroup', 'option',
         'colgroup', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th'
-    }
+    })
 
-    def __init__(self, html_content: str):
-        self.html_content = html_content
+    def __init__(self, sections: DocumentSections):
+        self.sections = sections
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
@@ -53,72 +142,62 @@ class HTMLValidator:
         Returns:
             ValidationResult containing validation status, errors, and warnings
         """
-        # Remove comments
-        content = re.sub(r'<!--.*?-->', '', self.html_content, flags=re.DOTALL)
-
-        # Remove script and style content (but keep tags)
-        content = re.sub(r'<script[^>]*>.*?</script>', '<script></script>', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(r'<style[^>]*>.*?</style>', '<style></style>', content, flags=re.DOTALL | re.IGNORECASE)
-
-        # Find all tags
-        tag_pattern = r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*(/?)>'
-        tags = re.finditer(tag_pattern, content)
-
+        # Open tags as (name, offset); offsets are only turned into line
+        # numbers when an error or warning is reported
+        line_of = self.sections.line_number
         tag_stack: List[Tuple[str, int]] = []
-        line_number = 1
-
-        for match in tags:
-            is_closing = match.group(1) == '/'
-            tag_name = match.group(2).lower()
-            is_self_closing = match.group(3) == '/' or tag_name in self.SELF_CLOSING_TAGS
 
-            # Update line number
-            line_number += content[:match.start()].count('\n') - (line_number - 1)
+        for match in self.sections.tags:
+            is_closing = match.group('closing') == b'/'
+            tag_name = _tag_name(match.group('name'))
 
             if is_closing:
                 # Closing tag
                 if not tag_stack:
                     self.errors.append(
-                        f"Line ~{line_number}: Closing tag </{tag_name}> without matching opening tag"
+                        f"Line ~{line_of(match.start())}: Closing tag </{tag_name}> without matching opening tag"
                     )
                 elif tag_stack[-1][0] != tag_name:
                     # Check if there's a matching tag further up the stack (possible nesting error)
-                    found_match = False
-                    for i in range(len(tag_stack) - 1, -1, -1):
+                    for i in range(len(tag_stack) - 2, -1, -1):
                         if tag_stack[i][0] == tag_name:
-                            found_match = True
-                            # Report all unclosed tags between current and matching tag
-                            for j in range(len(tag_stack) - 1, i, -1):
-                                self.errors.append(
-                                    f"Line ~{tag_stack[j][1]}: Unclosed tag <{tag_stack[j][0]}> "
-                                    f"(expected before </{tag_name}> on line ~{line_number})"
-                                )
-                            # Remove all tags from matching tag onwards
-                            tag_stack = tag_stack[:i]
                             break
-
-                    if not found_match:
+                    else:
+                        i = -1
+
+                    if i >= 0:
+                        # Pop and report all unclosed tags between current and matching tag
+                        line_number = line_of(match.start())
+                        while len(tag_stack) > i + 1:
+                            unclosed_name, unclosed_offset = tag_stack.pop()
+                            self.errors.append(
+                                f"Line ~{line_of(unclosed_offset)}: Unclosed tag <{unclosed_name}> "
+                                f"(expected before </{tag_name}> on line ~{line_number})"
+                            )
+                        # Remove the matching tag
+                        tag_stack.pop()
+                    else:
+                        open_name, open_offset = tag_stack.pop()
                         self.errors.append(
-                            f"Line ~{line_number}: Closing tag </{tag_name}> doesn't match "
-                            f"opening tag <{tag_stack[-1][0]}> from line ~{tag_stack[-1][1]}"
+                            f"Line ~{line_of(match.start())}: Closing tag </{tag_name}> doesn't match "
+                            f"opening tag <{open_name}> from line ~{line_of(open_offset)}"
                         )
-                        tag_stack.pop()
                 else:
                     tag_stack.pop()
 
-            elif not is_self_closing:
+            elif not (tag_name in self.SELF_CLOSING_TAGS or match.group('self_closing') == b'/'):
                 # Opening tag (not self-closing)
-                tag_stack.append((tag_name, line_number))
+                tag_stack.append((tag_name, match.start()))
 
         # Check for unclosed tags
-        for tag_name, line_num in tag_stack:
+        for tag_name, offset in tag_stack:
             if tag_name not in self.OPTIONAL_CLOSE_TAGS:
                 self.errors.append(
-                    f"Line ~{line_num}: Unclosed tag <{tag_name}>"
+                    f"Line ~{line_of(offset)}: Unclosed tag <{tag_name}>"
                 )
             else:
                 self.warnings.append(
-                    f"Line ~{line_num}: Tag <{tag_name}> not explicitly closed (optional)"
+                    f"Line ~{line_of(offset)}: Tag <{tag_name}> not explicitly closed (optional)"
                 )
 
         return ValidationResult(
@@ -131,32 +210,33 @@ class HTMLValidator:
 class JavaScriptHTMLValidator:
     """Validates HTML tag structure in JavaScript string concatenation."""
 
-    def __init__(self, js_content: str):
-        self.js_content = js_content
+    def __init__(self, sections: DocumentSections):
+        self.sections = sections
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
-    def extract_html_concatenations(self) -> Dict[int, List[str]]:
+    def extract_html_concatenations(self) -> Dict[int, List[bytes]]:
         """
-        Extract HTML strings from JavaScript += operations.
+        Extract HTML strings from JavaScript += operations in <script> elements.
 
         Returns:
             Dict mapping line numbers to HTML fragments
         """
-        html_fragments: Dict[int, List[str]] = {}
-        lines = self.js_content.split('\n')
+        html_fragments: Dict[int, List[bytes]] = {}
+        sections = self.sections
 
-        # Pattern to match: html += '...' or html += "..." or html += `...`
-        pattern = r"html\s*\+=\s*['\"`](.*?)['\"`]"
-
-        for line_num, line in enumerate(lines, 1):
-            # Skip comments
-            if line.strip().startswith('//'):
+        for start, end in sections.script_spans:
+            # Cheap probe: scripts that never mention html need no regex scan
+            if sections.content.find(b'html', start, end) < 0:
                 continue
 
-            matches = re.findall(pattern, line)
-            if matches:
-                html_fragments[line_num] = matches
+            for match in _RE_CONCAT.finditer(sections.content, start, end):
+                # Skip comments
+                if match.lastindex is None:
+                    continue
+
+                line_num = sections.line_number(match.start())
+                html_fragments.setdefault(line_num, []).append(match.group(match.lastindex))
 
         return html_fragments
 
@@ -180,17 +260,9 @@ class JavaScriptHTMLValidator:
         # Track opening and closing tags for each line
         for line_num, html_strings in fragments.items():
             for html_str in html_strings:
-                # Count opening and closing tags
-                opening_tags = re.findall(r'<([a-zA-Z][a-zA-Z0-9]*)[^>]*(?<!/)>', html_str)
-                closing_tags = re.findall(r'</([a-zA-Z][a-zA-Z0-9]*)>', html_str)
-
-                # Filter out self-closing tags
-                self_closing = {'br', 'hr', 'img', 'input', 'link', 'meta', 'source'}
-                opening_tags = [tag for tag in opening_tags if tag.lower() not in self_closing]
-
                 # Check for specific anti-pattern: </div></div> when opening fewer than 2 divs
-                if '</div></div>' in html_str:
-                    div_opens = html_str.count('<div')
+                if b'</div></div>' in html_str:
+                    div_opens = html_str.count(b'<div')
                     # Bug pattern: closing 2 divs but opening 0 or 1
                     # This causes premature closing of parent containers
                     if 0 < div_opens < 2:
@@ -222,25 +294,24 @@ class JavaScriptHTMLValidator:
 class EmbeddedMarkdownValidator:
     """Validates embedded Markdown content in JavaScript template literals."""
 
-    def __init__(self, js_content: str):
-        self.js_content = js_content
+    def __init__(self, sections: DocumentSections):
+        self.sections = sections
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
-    def extract_markdown_content(self) -> str:
+    def extract_markdown_content(self) -> bytes:
         """
         Extract embedded Markdown from markdownContent template literal.
 
         Returns:
-            The markdown content string, or empty string if not found
+            The markdown content bytes, or empty bytes if not found
         """
-        # Find the markdownContent template literal
-        pattern = r'const markdownContent = `(.*?)`;'
-        match = re.search(pattern, self.js_content, flags=re.DOTALL)
-
-        if match:
-            return match.group(1)
-        return ""
+        # Find the markdownContent template literal (only <script> bodies can hold it)
+        for start, end in self.sections.script_spans:
+            match = _RE_MD_TEMPLATE.search(self.sections.content, start, end)
+            if match:
+                return match.group(1)
+        return b""
 
     def validate_code_block_markers(self) -> ValidationResult:
         r"""
@@ -259,24 +330,28 @@ class EmbeddedMarkdownValidator:
             self.warnings.append("No embedded Markdown content found")
             return ValidationResult(is_valid=True, errors=[], warnings=self.warnings)
 
-        lines = markdown_content.split('\n')
-
-        # Check for properly escaped backticks (e.g., \`\`\`dart)
-        escaped_pattern = r'\\`\\`\\`'
-        escaped_count = sum(1 for line in lines if re.search(escaped_pattern, line))
-
-        # Count code block markers (escaped)
-        opening_markers = sum(1 for line in lines if line.strip() == '\\`\\`\\`dart')
-        closing_markers = sum(1 for line in lines if line.strip() == '\\`\\`\\`')
-
-        # Check for UNESCAPED backticks (which would cause JavaScript syntax errors)
-        unescaped_pattern = r'(?<!\\)`'
+        opening_markers = closing_markers = 0
         unescaped_lines = []
-        for line_num, line in enumerate(lines, 1):
-            if re.search(unescaped_pattern, line):
-                unescaped_lines.append(line_num)
-                if len(unescaped_lines) >= 3:
-                    break
+
+        # One pass over the lines for both checks, read one at a time (BytesIO
+        # shares the buffer instead of building a list of every line)
+        for line_num, line in enumerate(io.BytesIO(markdown_content), 1):
+            # Count code block markers (escaped, e.g. \`\`\`dart)
+            stripped = line.strip()
+            if stripped == _ESCAPED_FENCE_OPEN:
+                opening_markers += 1
+            elif stripped == _ESCAPED_FENCE_CLOSE:
+                closing_markers += 1
+
+            # Check for UNESCAPED backticks (which would cause JavaScript syntax
+            # errors); the first three are enough to report
+            if len(unescaped_lines) < 3:
+                pos = line.find(b'`')
+                while pos >= 0:
+                    if pos == 0 or line[pos - 1] != _BACKSLASH:
+                        unescaped_lines.append(line_num)
+                        break
+                    pos = line.find(b'`', pos + 1)
 
         if unescaped_lines:
             for line_num in unescaped_lines:
@@ -317,6 +392,31 @@ class EmbeddedMarkdownValidator:
         return self.validate_code_block_markers()
 
 
+def _map_file(path: Path):
+    """
+    Map a file read-only, so all validators scan one page-cache-backed buffer.
+
+    The map is bytes-like (the bytes patterns search it directly). Empty files
+    cannot be mapped and are returned as b''.
+    """
+    with path.open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _emit(header: str, items: List[str]):
+    """Write a header and its items as a bulleted list in one call (nothing if empty)."""
+    if items:
+        sys.stdout.write(f"\n{header}:\n\n" + ''.join(f"  • {item}\n" for item in items))
+
+
+def _report(result: ValidationResult, label: str):
+    """Print a validator's errors and warnings."""
+    _emit(f"❌ Found {len(result.errors)} {label} error(s)", result.errors)
+    _emit(f"⚠️  Found {len(result.warnings)} {label} warning(s)", result.warnings)
+
+
 def main():
     """Main entry point."""
     script_dir = Path(__file__).parent
@@ -330,55 +430,31 @@ def main():
     print("-" * 60)
 
     try:
-        html_content = html_file.read_text(encoding='utf-8')
+        html_content = _map_file(html_file)
     except Exception as e:
         print(f"❌ Error reading file: {e}")
         sys.exit(1)
 
+    # Tokenize once; each validator works from the shared sections
+    sections = _extract_sections(html_content)
+
     # Validate rendered HTML
     print("\n📄 Validating rendered HTML structure...")
-    html_validator = HTMLValidator(html_content)
+    html_validator = HTMLValidator(sections)
     html_result = html_validator.validate()
-
-    if html_result.errors:
-        print(f"\n❌ Found {len(html_result.errors)} HTML error(s):\n")
-        for error in html_result.errors:
-            print(f"  • {error}")
-
-    if html_result.warnings:
-        print(f"\n⚠️  Found {len(html_result.warnings)} HTML warning(s):\n")
-        for warning in html_result.warnings:
-            print(f"  • {warning}")
+    _report(html_result, "HTML")
 
     # Validate JavaScript HTML generation
     print("\n🔧 Validating JavaScript HTML generation...")
-    js_validator = JavaScriptHTMLValidator(html_content)
+    js_validator = JavaScriptHTMLValidator(sections)
     js_result = js_validator.validate()
-
-    if js_result.errors:
-        print(f"\n❌ Found {len(js_result.errors)} JavaScript HTML error(s):\n")
-        for error in js_result.errors:
-            print(f"  • {error}")
-
-    if js_result.warnings:
-        print(f"\n⚠️  Found {len(js_result.warnings)} JavaScript HTML warning(s):\n")
-        for warning in js_result.warnings:
-            print(f"  • {warning}")
+    _report(js_result, "JavaScript HTML")
 
     # Validate embedded Markdown
     print("\n📝 Validating embedded Markdown content...")
-    md_validator = EmbeddedMarkdownValidator(html_content)
+    md_validator = EmbeddedMarkdownValidator(sections)
     md_result = md_validator.validate()
-
-    if md_result.errors:
-        print(f"\n❌ Found {len(md_result.errors)} Markdown error(s):\n")
-        for error in md_result.errors:
-            print(f"  • {error}")
-
-    if md_result.warnings:
-        print(f"\n⚠️  Found {len(md_result.warnings)} Markdown warning(s):\n")
-        for warning in md_result.warnings:
-            print(f"  • {warning}")
+    _report(md_result, "Markdown")
 
     # Overall result
     all_valid = html_result.is_valid and js_result.is_valid and md_result.is_valid
@@ -386,12 +462,13 @@ def main():
     total_warnings = len(html_result.warnings) + len(js_result.warnings) + len(md_result.warnings)
 
     if all_valid and not total_warnings:
+        line_count = len(sections.newline_offsets) + 1
         print("\n✅ All HTML tags are properly opened and closed!")
         print("✅ JavaScript HTML generation is correct!")
         print("✅ Embedded Markdown content is valid!")
         print("\n📊 Summary:")
         print(f"  • File size: {len(html_content):,} bytes")
-        print(f"  • Lines: {html_content.count(chr(10)) + 1:,}")
+        print(f"  • Lines: {line_count:,}")
         sys.exit(0)
     elif all_valid:
         print(f"\n✅ No critical errors found ({total_warnings} warning(s) only)")